@@ -0,0 +1,50 @@
+"""Helpers shared by the LangChain chat examples."""
+
+import asyncio
+import threading
+
+
+async def read_input(prompt: str) -> str:
+    """Read a line without blocking the event loop, so the SSE connections keep
+    being serviced. A daemon thread is used rather than asyncio.to_thread so
+    that an unanswered prompt doesn't stop the process from exiting."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(result=None, error=None):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def read():
+        try:
+            result, error = input(prompt), None
+        except (EOFError, KeyboardInterrupt) as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            pass  # The event loop has already shut down
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+async def stream_reply(agent_executor, user_input: str, chat_history: list) -> str:
+    """Run one agent turn, printing tokens as they arrive rather than waiting
+    for the full answer, and return the final output."""
+    print("\nAssistant: ", end="", flush=True)
+    output = ""
+    async for event in agent_executor.astream_events(
+        {"input": user_input, "chat_history": chat_history},
+        version="v2",
+    ):
+        if event["event"] == "on_chat_model_stream":
+            print(event["data"]["chunk"].content, end="", flush=True)
+        elif event["event"] == "on_chain_end" and event["name"] == "AgentExecutor":
+            output = event["data"]["output"]["output"]
+    print()
+    return output
@@ -4,6 +4,10 @@ Setup:
     uv pip install langchain==0.3.21 langchain-mcp-adapters==0.0.5 langchain-openai==0.3.10
 
     export OPENAI_API_KEY=<your-openai-api-key>
+    # Optional: use a smaller model for faster agent steps, e.g. gpt-4.1-nano
+    export OPENAI_MODEL=gpt-4o-mini
+    # Optional: request OpenAI's lower-latency priority processing tier
+    export OPENAI_SERVICE_TIER=priority
 
 Put this in your `servers.yaml` file:
 
@@ -50,9 +54,18 @@ from langchain_openai import ChatOpenAI
 from langchain.agents import AgentExecutor, create_openai_functions_agent
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 
+from chat_helpers import read_input, stream_reply
+
 if not os.environ.get("OPENAI_API_KEY"):
     raise ValueError("OPENAI_API_KEY environment variable must be set")
 
+OPENAI_MODEL = os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
+OPENAI_SERVICE_TIER = os.environ.get("OPENAI_SERVICE_TIER")
+
+# Number of past messages sent with each turn. Older messages are dropped
+# so per-turn prompt size (and latency) stays bounded.
+MAX_CHAT_HISTORY = 12
+
 
 async def run_agent(weather_auth_header: str):
     async with MultiServerMCPClient(
@@ -73,7 +86,14 @@ async def run_agent(weather_auth_header: str):
     ) as client:
         tools = client.get_tools()
         # Initialize the chat model
-        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+        llm = ChatOpenAI(
+            model=OPENAI_MODEL,
+            temperature=0,
+            streaming=True,
+            model_kwargs=(
+                {"service_tier": OPENAI_SERVICE_TIER} if OPENAI_SERVICE_TIER else {}
+            ),
+        )
 
         # Create the prompt template
         prompt = ChatPromptTemplate.from_messages(
@@ -90,26 +110,26 @@ async def run_agent(weather_auth_header: str):
         )
 
         agent = create_openai_functions_agent(llm=llm, tools=tools, prompt=prompt)
-        agent_executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
+        agent_executor = AgentExecutor(agent=agent, tools=tools)
 
         chat_history = []
         while True:
             try:
-                user_input = input("\nYou: ")
+                user_input = await read_input("\nYou: ")
                 if user_input.lower() == "exit":
                     break
-                response = await agent_executor.ainvoke(
-                    {"input": user_input, "chat_history": chat_history}
-                )
-                print("\nAssistant:", response["output"])
+
+                output = await stream_reply(agent_executor, user_input, chat_history)
                 chat_history.extend(
                     [
                         HumanMessage(content=user_input),
-                        AIMessage(content=response["output"]),
+                        AIMessage(content=output),
                     ]
                 )
+                del chat_history[:-MAX_CHAT_HISTORY]
 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
+                # Under asyncio.run, Ctrl+C at the prompt cancels this task
                 print("\nChat session terminated by user")
                 break
 
@@ -52,6 +52,17 @@ from mcp.client.sse import sse_client
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Maximum number of characters of tool output to include in INFO logs
+MAX_LOGGED_RESULT_LENGTH = 512
+
+
+def summarize_result(result: types.CallToolResult) -> str:
+    """Return the text content of a tool result, truncated for logging."""
+    text = "".join(c.text for c in result.content if isinstance(c, types.TextContent))
+    if len(text) > MAX_LOGGED_RESULT_LENGTH:
+        text = text[:MAX_LOGGED_RESULT_LENGTH] + "…"
+    return text
+
 
 async def handle_sampling_message(
     message: types.CreateMessageRequestParams,
@@ -90,29 +101,31 @@ async def run_agent(context: FakeUseContext):
             tools = await session.list_tools()
             logger.info("Available tools: %s", tools)
 
-            # Call the weather forecast tool
-            try:
-                result = await session.call_tool(
+            async def _call_tool(name: str, arguments: dict):
+                try:
+                    return await session.call_tool(name, arguments=arguments)
+                except Exception as e:
+                    logger.error("Error calling %s tool: %s", name, e)
+                    return None
+
+            # The tool calls are independent, so run them concurrently.
+            weather, httpbin = await asyncio.gather(
+                _call_tool(
                     "weather/v1/forecast",
-                    arguments={
+                    {
                         "latitude": 52.52,
                         "longitude": 13.41,
                         "hourly": ["temperature_2m", "relative_humidity_2m"],
                     },
-                )
-                logger.info("Weather forecast result: %s", result)
-            except Exception as e:
-                logger.error("Error calling weather tool: %s", e)
-
-            # Call an httpbin tool
-            try:
-                result = await session.call_tool(
-                    "httpbin/get",
-                    arguments={"name": "test"},
-                )
-                logger.info("Httpbin result: %s", result)
-            except Exception as e:
-                logger.error("Error calling httpbin tool: %s", e)
+                ),
+                _call_tool("httpbin/get", {"name": "test"}),
+            )
+            if weather is not None:
+                logger.info("Weather forecast result: %s", summarize_result(weather))
+                logger.debug("Full weather forecast result: %s", weather)
+            if httpbin is not None:
+                logger.info("Httpbin result: %s", summarize_result(httpbin))
+                logger.debug("Full httpbin result: %s", httpbin)
 
 
 if __name__ == "__main__":
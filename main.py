@@ -10,6 +10,11 @@ import asyncio
 from watchdog.observers import Observer
 import uvicorn
 
+try:
+    import uvloop
+except ImportError:  # optional, not available on Windows
+    uvloop = None
+
 # project
 from mcp_openapi.server_manager import ServerManager
 from mcp_openapi.file_watcher import ConfigFileHandler
@@ -29,6 +34,11 @@ async def main():
     parser.add_argument(
         "--port", type=int, default=8000, help="Port to run the server on"
     )
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        help="Enable uvicorn's per-request access log",
+    )
     args = parser.parse_args()
 
     server_manager = ServerManager(args.config)
@@ -39,7 +49,7 @@ async def main():
     # Set up file watching with the event loop
     observer = Observer()
     observer.schedule(
-        ConfigFileHandler(server_manager, loop),
+        ConfigFileHandler(server_manager, loop, args.config),
         path=os.path.dirname(os.path.abspath(args.config)),
         recursive=False,
     )
@@ -48,18 +58,31 @@ async def main():
     try:
         # Start all servers
         await server_manager.start_servers()
+        # Warm upstream connections in the background; keep a reference so the
+        # task isn't garbage-collected before it finishes
+        warm_up = asyncio.create_task(server_manager.warm_up())
 
         # Get the Starlette app and run it
         app = server_manager.get_app()
-        config = uvicorn.Config(app, host="0.0.0.0", port=args.port, loop=loop)
+        # http="auto" already picks httptools when it's installed.
+        config = uvicorn.Config(
+            app,
+            host="0.0.0.0",
+            port=args.port,
+            access_log=args.access_log,
+            backlog=2048,
+            timeout_keep_alive=30,
+        )
         server = uvicorn.Server(config)
         await server.serve()
     except KeyboardInterrupt:
         log.info("Shutting down...")
         await server_manager.stop_servers()
+        await server_manager.aclose()
         observer.stop()
         observer.join()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when it's installed.
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
@@ -1,7 +1,8 @@
 # stdlib
 import logging
-import time
 import asyncio
+import pathlib
+from typing import Optional
 
 # 3p
 from watchdog.events import FileSystemEventHandler
@@ -11,29 +12,62 @@ from mcp_openapi.server_manager import ServerManager
 
 log = logging.getLogger(__name__)
 
+# Seconds to wait after the last change event before reloading.
+DEBOUNCE_DELAY = 0.5
+
+CONFIG_SUFFIXES = frozenset({".yaml", ".yml"})
+
 
 class ConfigFileHandler(FileSystemEventHandler):
-    def __init__(self, server_manager: ServerManager, loop: asyncio.AbstractEventLoop):
+    def __init__(
+        self,
+        server_manager: ServerManager,
+        loop: asyncio.AbstractEventLoop,
+        config_path: str,
+    ):
         self.server_manager = server_manager
-        self.last_modified = time.time()
+        self._watch_path = pathlib.Path(config_path).resolve()
         self.loop = loop
+        self._pending: Optional[asyncio.TimerHandle] = None
+        # The loop only holds weak references to tasks, so keep reloads until done
+        self._reload_tasks: set[asyncio.Task] = set()
+        self._reload_lock = asyncio.Lock()
 
     def on_modified(self, event):
-        # Ignore non-yaml files and directory events
-        if event.is_directory or not event.src_path.endswith(".yaml"):
+        # Ignore directory events and anything other than the config file
+        if event.is_directory:
             return
-
-        # Debounce multiple events
-        current_time = time.time()
-        if current_time - self.last_modified < 1:
+        src_path = pathlib.PurePath(event.src_path)
+        if src_path.suffix not in CONFIG_SUFFIXES:
+            return
+        if pathlib.Path(src_path).resolve() != self._watch_path:
             return
-        self.last_modified = current_time
 
         log.info(f"Config file changed: {event.src_path}")
-        asyncio.run_coroutine_threadsafe(self._handle_config_change(), self.loop)
+        # Called from the watchdog thread, so hop onto the event loop.
+        self.loop.call_soon_threadsafe(self._schedule_reload)
+
+    def _schedule_reload(self):
+        """Debounce bursts of events into a single reload."""
+        if self._pending is not None:
+            self._pending.cancel()
+        self._pending = self.loop.call_later(DEBOUNCE_DELAY, self._start_reload)
+
+    def _start_reload(self):
+        self._pending = None
+        task = self.loop.create_task(self._handle_config_change())
+        self._reload_tasks.add(task)
+        task.add_done_callback(self._reload_done)
+
+    def _reload_done(self, task: asyncio.Task):
+        self._reload_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error("Config reload failed", exc_info=task.exception())
 
     async def _handle_config_change(self):
         """Handle configuration changes asynchronously"""
-        await self.server_manager.stop_servers()
-        self.server_manager.load_config()
-        await self.server_manager.start_servers()
+        async with self._reload_lock:
+            await self.server_manager.stop_servers()
+            # Parse the YAML off the event loop so SSE sessions keep flowing.
+            await asyncio.to_thread(self.server_manager.load_config)
+            await self.server_manager.start_servers()
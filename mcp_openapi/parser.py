@@ -1,26 +1,218 @@
 # stdlib
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Iterator, Sequence
 import re
+import os
+import asyncio
 import logging
-import pickle
+import json
+import gc
+import gzip
+import mmap
 import hashlib
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 import pathlib
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # 3p
 import aiopenapi3
 from aiopenapi3.plugin import Document
 
+try:
+    import orjson
+except ImportError:  # optional, faster JSON for the spec cache
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional, shrinks the spec cache on disk
+    zstandard = None
+
 
 log = logging.getLogger(__name__)
 
-# Create cache directory in the user's home directory
-CACHE_DIR = Path.home() / ".mcp-openapi" / "cache"
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Cache directory in the user's home directory, overridable with
+# MCP_OPENAPI_CACHE (e.g. to point it at a tmpfs). It's created on first write.
+CACHE_DIR = Path(
+    os.environ.get("MCP_OPENAPI_CACHE", Path.home() / ".mcp-openapi" / "cache")
+)
+
+# Specs are cached as JSON, compressed with zstd when zstandard is installed
+# and with gzip otherwise
+CACHE_SUFFIX = ".json.zst" if zstandard else ".json.gz"
+
+# Cache file paths are built with os.path.join rather than Path's "/" operator
+_CACHE_DIR_STR = str(CACHE_DIR)
+
+
+# Parsed spec models are immutable once built and only carry declared fields
+MODEL_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+# Operation attributes on a path item, in the order they're processed
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+
+# Specs already loaded by this process, keyed by (source, sorted path patterns).
+# Values are ((mtime_ns, size) of the spec file, spec); that's None for URLs.
+_SPEC_MEMO: Dict[tuple, tuple[Optional[tuple[int, int]], "Spec"]] = {}
+
+
+# Structured-syntax JSON media types, e.g. application/problem+json
+JSON_SUFFIX_MEDIA_TYPE = re.compile(r"application/[^;]+\+json")
+
+
+def _json_media_type(
+    content: Optional[Dict[str, Any]],
+) -> Optional[tuple[str, Any]]:
+    """Return the (name, media type object) of the JSON entry in a content map.
+
+    An exact application/json entry wins over +json vendor types.
+    """
+    if not content:
+        return None
+    media_type = content.get("application/json")
+    if media_type is not None:
+        return "application/json", media_type
+    for name, media_type in content.items():
+        if JSON_SUFFIX_MEDIA_TYPE.match(name):
+            return name, media_type
+    return None
+
+
+@contextmanager
+def _gc_disabled() -> Iterator[None]:
+    """Pause the cyclic garbage collector while building many models at once.
+
+    Bulk allocation would otherwise trigger repeated collections that find
+    nothing to free. The previous GC state is restored on exit.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+@lru_cache(maxsize=512)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a path pattern, reusing the result across spec loads."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=128)
+def _path_matcher(path_patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    """Return a callable testing whether a path matches any of the patterns.
+
+    Patterns without groups are joined into one alternation. Patterns with groups
+    are matched on their own, since joining them would renumber their groups and
+    change what backreferences refer to.
+    """
+    compiled = [_compile_pattern(pattern) for pattern in path_patterns]
+    matchers = [pattern.match for pattern in compiled if pattern.groups]
+    plain = [pattern.pattern for pattern in compiled if not pattern.groups]
+    if plain:
+        try:
+            matchers.insert(
+                0,
+                _compile_pattern("|".join(f"(?:{pattern})" for pattern in plain)).match,
+            )
+        except re.error:
+            # e.g. global inline flags, which must start the whole expression
+            matchers[:0] = [_compile_pattern(pattern).match for pattern in plain]
+    if len(matchers) == 1:
+        return matchers[0]
+    return lambda path: any(match(path) for match in matchers)
+
+
+def _cache_key(source: str, sorted_patterns: tuple[str, ...]) -> str:
+    """Hash a spec source and its sorted path patterns into a cache key."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(source.encode())
+    h.update(b":")
+    h.update(",".join(sorted_patterns).encode())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=128)
+def _cache_file(
+    source: str, sorted_patterns: tuple[str, ...], version: str = ""
+) -> str:
+    """Return the cache file path for a spec source and its path patterns.
+
+    A version (e.g. the spec file's mtime and size) is appended after the key, so
+    every version of the same source shares a prefix and old ones can be pruned.
+    """
+    name = _cache_key(source, sorted_patterns)
+    if version:
+        name = f"{name}-{version}"
+    return os.path.join(_CACHE_DIR_STR, name + CACHE_SUFFIX)
+
+
+def _prune_cache(cache_file: str) -> None:
+    """Remove the other cached versions of the source cache_file belongs to."""
+    name = os.path.basename(cache_file)
+    prefix = name.split("-", 1)[0].removesuffix(CACHE_SUFFIX)
+    try:
+        entries = list(os.scandir(_CACHE_DIR_STR))
+    except OSError:
+        return
+    for entry in entries:
+        if (
+            entry.name != name
+            and entry.name.startswith(prefix)
+            and entry.name.endswith(CACHE_SUFFIX)
+        ):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass  # Another process may have removed it already
+
+
+def _read_cache(cache_file: str) -> Optional["Spec"]:
+    """Load a spec from the cache, or return None if it's missing or unreadable."""
+    if not os.path.exists(cache_file):
+        return None
+
+    log.info(f"Loading cached OpenAPI spec from {cache_file}")
+    try:
+        with open(cache_file, "rb") as f:
+            if zstandard:
+                # zstd decompresses straight from the mapped file, skipping a
+                # copy of the compressed bytes
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = zstandard.ZstdDecompressor().decompress(mm)
+            else:
+                data = gzip.decompress(f.read())
+        with _gc_disabled():
+            return Spec.load(data)
+    except Exception as e:
+        log.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+        return None
+
+
+def _write_cache(cache_file: str, spec: "Spec") -> None:
+    """Write a parsed spec to the cache.
+
+    The data is written to a temporary file and renamed into place so a crash
+    mid-write never leaves a truncated cache entry behind.
+    """
+    os.makedirs(_CACHE_DIR_STR, exist_ok=True)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    data = spec.dump()
+    if zstandard:
+        data = zstandard.ZstdCompressor(level=3).compress(data)
+    else:
+        data = gzip.compress(data, compresslevel=1)
+    with open(tmp_file, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file, cache_file)
 
 
 class Schema(BaseModel):
+    model_config = MODEL_CONFIG
+
     name: str
     type: str | list[str]  # Can be a single type or list of types for anyOf
     items: Optional["Schema"] = None
@@ -30,8 +222,33 @@ class Schema(BaseModel):
     any_of: Optional[List["Schema"]] = None  # For anyOf schemas
     all_of: Optional[List["Schema"]] = None  # For allOf schemas
 
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["Schema"]:
+        """Rebuild a schema from model_dump() output without re-validating."""
+        if data is None:
+            return None
+        return cls.model_construct(
+            **{
+                **data,
+                "items": cls.from_dict(data.get("items")),
+                "properties": cls._list_from_dict(data.get("properties")),
+                "any_of": cls._list_from_dict(data.get("any_of")),
+                "all_of": cls._list_from_dict(data.get("all_of")),
+            }
+        )
+
+    @classmethod
+    def _list_from_dict(
+        cls, data: Optional[List[Dict[str, Any]]]
+    ) -> Optional[List["Schema"]]:
+        if data is None:
+            return None
+        return [cls.from_dict(d) for d in data]
+
 
 class Parameter(BaseModel):
+    model_config = MODEL_CONFIG
+
     name: str
     in_: str = Field(alias="in")
     required: bool = False
@@ -47,15 +264,33 @@ class Parameter(BaseModel):
     default: Optional[Any] = None
     items: Optional["Schema"] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Parameter":
+        """Rebuild a parameter from model_dump() output without re-validating."""
+        return cls.model_construct(
+            **{**data, "items": Schema.from_dict(data.get("items"))}
+        )
+
 
 class Response(BaseModel):
+    model_config = MODEL_CONFIG
+
     description: str
     content: Optional[Dict[str, Any]] = None
     schema_: Optional[Schema] = None
     format: str = "text/plain"
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Response":
+        """Rebuild a response from model_dump() output without re-validating."""
+        return cls.model_construct(
+            **{**data, "schema_": Schema.from_dict(data.get("schema_"))}
+        )
+
 
 class RequestBody(BaseModel):
+    model_config = MODEL_CONFIG
+
     description: Optional[str] = None
     content: Optional[Dict[str, Any]] = None
     required: bool = False
@@ -63,8 +298,19 @@ class RequestBody(BaseModel):
     content_type: Optional[str] = None
     encoding: Optional[Dict[str, Dict[str, Any]]] = None
 
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["RequestBody"]:
+        """Rebuild a request body from model_dump() output without re-validating."""
+        if data is None:
+            return None
+        return cls.model_construct(
+            **{**data, "schema_": Schema.from_dict(data.get("schema_"))}
+        )
+
 
 class Operation(BaseModel):
+    model_config = MODEL_CONFIG
+
     id: str
     summary: Optional[str] = None
     description: Optional[str] = None
@@ -72,8 +318,27 @@ class Operation(BaseModel):
     request_body_: RequestBody | None = None
     responses: Dict[str, Response]
 
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["Operation"]:
+        """Rebuild an operation from model_dump() output without re-validating."""
+        if data is None:
+            return None
+        return cls.model_construct(
+            **{
+                **data,
+                "parameters": [Parameter.from_dict(p) for p in data["parameters"]],
+                "request_body_": RequestBody.from_dict(data.get("request_body_")),
+                "responses": {
+                    status_code: Response.from_dict(response)
+                    for status_code, response in data["responses"].items()
+                },
+            }
+        )
+
 
 class Path(BaseModel):
+    model_config = MODEL_CONFIG
+
     path: str
     get: Optional[Operation] = None
     post: Optional[Operation] = None
@@ -81,18 +346,28 @@ class Path(BaseModel):
     delete: Optional[Operation] = None
     patch: Optional[Operation] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Path":
+        """Rebuild a path from model_dump() output without re-validating."""
+        return cls.model_construct(
+            path=data["path"],
+            **{
+                method: Operation.from_dict(data.get(method)) for method in HTTP_METHODS
+            },
+        )
+
 
 class FilterPaths(Document):
-    def __init__(self, path_patterns: list[str]):
+    def __init__(self, path_patterns: Sequence[str]):
         super().__init__()
-        self._path_patterns = [re.compile(pattern) for pattern in path_patterns]
+        self._matches_path = _path_matcher(tuple(path_patterns))
 
     def parsed(self, ctx: "Document.Context") -> "Document.Context":
-        ctx.document["paths"] = {
-            k: v
-            for k, v in ctx.document["paths"].items()
-            if any(pattern.match(k) for pattern in self._path_patterns)
-        }
+        # Delete non-matching paths in place rather than copying the matches
+        paths = ctx.document["paths"]
+        matches_path = self._matches_path
+        for key in [key for key in paths if not matches_path(key)]:
+            del paths[key]
         return ctx
 
 
@@ -122,91 +397,184 @@ class Spec:
         base_path=pathlib.Path("").absolute(),
         use_cache=True,
     ) -> "Spec":
-        cache_key = hashlib.md5(
-            f"{file_path}:{','.join(sorted(path_patterns))}".encode()
-        ).hexdigest()
-        cache_file = CACHE_DIR / f"{cache_key}.pickle"
-
-        # Create cache key from file path and patterns
-        if use_cache and cache_file.exists():
-            log.info(f"Loading cached OpenAPI spec from {cache_file}")
-            with open(cache_file, "rb") as f:
-                return pickle.load(f)
-
-        log.info(f"Loading OpenAPI spec from {file_path}")
-
-        api = aiopenapi3.OpenAPI.load_file(
-            file_path,
+        sorted_patterns = tuple(sorted(path_patterns))
+        memo_key = (file_path, sorted_patterns)
+        try:
+            stat = os.stat(file_path)
+            version: Optional[tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            version = None
+        if use_cache and version is not None:
+            memoized = _SPEC_MEMO.get(memo_key)
+            if memoized is not None and memoized[0] == version:
+                return memoized[1]
+
+        # Version the disk cache with the file's mtime and size too, so edits
+        # aren't answered with the copy parsed from the previous version
+        cache_file = _cache_file(
             file_path,
-            loader=aiopenapi3.FileSystemLoader(base_path),
-            plugins=[RemovePaths(), FilterPaths(path_patterns)],
+            sorted_patterns,
+            "" if version is None else f"{version[0]}-{version[1]}",
         )
-        spec = cls._from_api(api, path_patterns)
 
-        # Cache the result
-        with open(cache_file, "wb") as f:
-            pickle.dump(spec, f)
+        spec = _read_cache(cache_file) if use_cache else None
+        if spec is None:
+            log.info(f"Loading OpenAPI spec from {file_path}")
 
+            api = aiopenapi3.OpenAPI.load_file(
+                file_path,
+                file_path,
+                loader=aiopenapi3.FileSystemLoader(base_path),
+                plugins=[RemovePaths(), FilterPaths(sorted_patterns)],
+            )
+            spec = cls._from_api(api)
+
+            _write_cache(cache_file, spec)
+            _prune_cache(cache_file)
+
+        _SPEC_MEMO[memo_key] = (version, spec)
         return spec
 
     @classmethod
     def from_url(cls, url: str, path_patterns: list[str], use_cache=True) -> "Spec":
-        cache_key = hashlib.md5(
-            f"{url}:{','.join(sorted(path_patterns))}".encode()
-        ).hexdigest()
-        cache_file = CACHE_DIR / f"{cache_key}.pickle"
+        sorted_patterns = tuple(sorted(path_patterns))
+        spec = cls._cached_url(url, sorted_patterns) if use_cache else None
+        if spec is None:
+            log.info(f"Cold loading OpenAPI spec from {url}")
+            api = aiopenapi3.OpenAPI.load_sync(
+                url,
+                loader=aiopenapi3.FileSystemLoader(pathlib.Path("")),
+                plugins=[RemovePaths(), FilterPaths(sorted_patterns)],
+            )
+            spec = cls._store_url(url, sorted_patterns, api)
+        return spec
 
-        if use_cache and cache_file.exists():
-            log.info(f"Loading cached OpenAPI spec from {cache_file}")
-            with open(cache_file, "rb") as f:
-                return pickle.load(f)
+    @classmethod
+    def from_urls(
+        cls, urls: list[str], path_patterns: list[str], use_cache=True
+    ) -> list[Optional["Spec"]]:
+        """Load several specs, fetching the uncached ones concurrently.
 
+        A URL that fails to load is logged and returned as None so it does not
+        fail the others. Must not be called from a running event loop.
+        """
+        sorted_patterns = tuple(sorted(path_patterns))
+        specs = {
+            url: cls._cached_url(url, sorted_patterns) if use_cache else None
+            for url in urls
+        }
+        missing = [url for url, spec in specs.items() if spec is None]
+        if missing:
+
+            async def cold_load_all() -> list:
+                return await asyncio.gather(
+                    *(cls._cold_load_url(url, sorted_patterns) for url in missing),
+                    return_exceptions=True,
+                )
+
+            for url, result in zip(missing, asyncio.run(cold_load_all())):
+                if isinstance(result, Exception):
+                    log.error(f"Failed to load OpenAPI spec from {url}: {result}")
+                    result = None
+                specs[url] = result
+        return [specs[url] for url in urls]
+
+    @classmethod
+    async def _cold_load_url(cls, url: str, sorted_patterns: tuple[str, ...]) -> "Spec":
         log.info(f"Cold loading OpenAPI spec from {url}")
-        api = aiopenapi3.OpenAPI.load_sync(
+        api = await aiopenapi3.OpenAPI.load_async(
             url,
             loader=aiopenapi3.FileSystemLoader(pathlib.Path("")),
-            plugins=[RemovePaths(), FilterPaths(path_patterns)],
+            plugins=[RemovePaths(), FilterPaths(sorted_patterns)],
         )
-        spec = cls._from_api(api, path_patterns)
-
-        # Cache the result
-        with open(cache_file, "wb") as f:
-            pickle.dump(spec, f)
+        return cls._store_url(url, sorted_patterns, api)
+
+    @staticmethod
+    def _cached_url(url: str, sorted_patterns: tuple[str, ...]) -> Optional["Spec"]:
+        """Return the memoized or on-disk cached spec for a URL, if any."""
+        memo_key = (url, sorted_patterns)
+        if memo_key in _SPEC_MEMO:
+            return _SPEC_MEMO[memo_key][1]
+
+        spec = _read_cache(_cache_file(url, sorted_patterns))
+        if spec is not None:
+            _SPEC_MEMO[memo_key] = (None, spec)
+        return spec
 
+    @classmethod
+    def _store_url(
+        cls,
+        url: str,
+        sorted_patterns: tuple[str, ...],
+        api: aiopenapi3.OpenAPI,
+    ) -> "Spec":
+        """Parse a freshly loaded URL spec and add it to both caches."""
+        spec = cls._from_api(api)
+        _write_cache(_cache_file(url, sorted_patterns), spec)
+        _SPEC_MEMO[(url, sorted_patterns)] = (None, spec)
         return spec
 
     @classmethod
-    def _from_api(cls, api: aiopenapi3.OpenAPI, path_patterns: list[str]) -> "Spec":
+    def _from_api(cls, api: aiopenapi3.OpenAPI) -> "Spec":
+        """Build a spec from an API loaded with the FilterPaths plugin.
+
+        FilterPaths has already dropped the paths that don't match the
+        configured patterns, so every remaining path is processed.
+        """
         paths = []
 
-        compiled_patterns = [re.compile(pattern) for pattern in path_patterns]
-        for path, path_item in api.paths.paths.items():
-            # Check if path matches any of the patterns
-            if not any(pattern.match(path) for pattern in compiled_patterns):
-                continue
-
-            processed_path = Path(path=path)
-            if path_item.get:
-                processed_path.get = cls._process_operation(path, path_item.get, api)
-            if path_item.post:
-                processed_path.post = cls._process_operation(path, path_item.post, api)
-            if path_item.put:
-                processed_path.put = cls._process_operation(path, path_item.put, api)
-            if path_item.delete:
-                processed_path.delete = cls._process_operation(
-                    path, path_item.delete, api
-                )
-            if path_item.patch:
-                processed_path.patch = cls._process_operation(
-                    path, path_item.patch, api
-                )
-            paths.append(processed_path)
+        process_operation = cls._process_operation
+        # Shared across operations so common component schemas are built once
+        schema_cache: Dict[str | int, Optional[Schema]] = {}
+        with _gc_disabled():
+            for path, path_item in api.paths.paths.items():
+                operations = {}
+                for method in HTTP_METHODS:
+                    operation = getattr(path_item, method)
+                    if operation is not None:
+                        operations[method] = process_operation(
+                            path, operation, api, schema_cache
+                        )
+                paths.append(Path.model_construct(path=path, **operations))
 
         return cls(paths=paths)
 
     def __init__(self, paths: List[Path]) -> None:
         self.paths = paths
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the spec as plain JSON-compatible data."""
+        return {
+            "paths": [
+                path.model_dump(mode="json", by_alias=True) for path in self.paths
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Spec":
+        """Rebuild a spec from to_dict() output.
+
+        The data was produced from already-validated models, so nested models
+        are rebuilt with model_construct instead of being validated again.
+        """
+        return cls(paths=[Path.from_dict(p) for p in data["paths"]])
+
+    def dump(self) -> bytes:
+        """Serialize the spec to JSON for the on-disk cache.
+
+        Unlike pickle, loading the result back can't execute arbitrary code.
+        """
+        data = self.to_dict()
+        if orjson:
+            # Like json.dumps, accept non-string keys (e.g. YAML integer keys)
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    @classmethod
+    def load(cls, data: bytes) -> "Spec":
+        """Rebuild a spec serialized with dump()."""
+        return cls.from_dict(orjson.loads(data) if orjson else json.loads(data))
+
     @classmethod
     def handle_any_of(
         cls, schemas, api, depth=0, max_depth=10, visited=None
@@ -217,7 +585,7 @@ class Spec:
             result = cls._process_schema(sub_schema, api, depth + 1, max_depth, visited)
             if result:
                 any_of_schemas.append(
-                    Schema(
+                    Schema.model_construct(
                         name=result.name,
                         type=sub_schema.type or "object",
                         properties=result.properties,
@@ -236,7 +604,7 @@ class Spec:
             result = cls._process_schema(sub_schema, api, depth + 1, max_depth, visited)
             if result:
                 all_schemas.append(
-                    Schema(
+                    Schema.model_construct(
                         name=result.name,
                         type="object",
                         properties=result.properties,
@@ -250,8 +618,9 @@ class Spec:
         cls, item_schema, api, depth, max_depth, visited
     ) -> Schema:
         """Helper method to process array items"""
-        if hasattr(item_schema, "ref") and item_schema.ref:
-            item_name = item_schema.ref.split("/")[-1]
+        item_ref = getattr(item_schema, "ref", None)
+        if item_ref:
+            item_name = item_ref.split("/")[-1]
             resolved_item_schema = api.components.schemas[item_name]
             if resolved_item_schema.type == "object":
                 item_properties = []
@@ -260,26 +629,29 @@ class Spec:
                     item_prop_schema,
                 ) in resolved_item_schema.properties.items():
                     item_prop_type = item_prop_schema.type or "object"
-                    item_prop = Schema(
-                        name=item_prop_name,
-                        type=item_prop_type,
-                        description=item_prop_schema.description,
-                    )
+                    item_prop_properties = None
                     if item_prop_type == "object":
                         nested_schema = cls._process_schema(
                             item_prop_schema, api, depth + 1, max_depth, visited
                         )
                         if nested_schema:
-                            item_prop.properties = nested_schema.properties
-                    item_properties.append(item_prop)
-                return Schema(
+                            item_prop_properties = nested_schema.properties
+                    item_properties.append(
+                        Schema.model_construct(
+                            name=item_prop_name,
+                            type=item_prop_type,
+                            description=item_prop_schema.description,
+                            properties=item_prop_properties,
+                        )
+                    )
+                return Schema.model_construct(
                     name=item_name,
                     type="object",
                     properties=item_properties,
                     description=item_schema.description,
                 )
 
-        return Schema(
+        return Schema.model_construct(
             name="item",
             type=item_schema.type or "object",
             description=item_schema.description,
@@ -287,9 +659,21 @@ class Spec:
 
     @classmethod
     def _process_schema(
-        cls, schema, api, depth=0, max_depth=10, visited=None
+        cls, schema, api, depth=0, max_depth=10, visited=None, schema_cache=None
     ) -> Optional[Schema]:
-        """Process schema and return a Schema model."""
+        """Process schema and return a Schema model.
+
+        Top-level results are memoized in schema_cache (keyed by $ref, or by
+        object id for inline schemas) when one is given. Nested calls aren't
+        cached since their result depends on the visited refs of the enclosing
+        walk.
+        """
+        if schema_cache is not None and visited is None:
+            key = getattr(schema, "ref", None) or id(schema)
+            if key not in schema_cache:
+                schema_cache[key] = cls._process_schema(schema, api, depth, max_depth)
+            return schema_cache[key]
+
         # Initialize visited set if None
         if visited is None:
             visited = set()
@@ -299,17 +683,15 @@ class Spec:
             log.debug(f"Max depth {max_depth} reached, stopping recursion")
             return None
 
-        # Handle circular references
-        if hasattr(schema, "ref") and schema.ref:
-            schema_ref = schema.ref
+        # Handle circular references and resolve the schema
+        schema_ref = getattr(schema, "ref", None)
+        if schema_ref:
             if schema_ref in visited:
                 log.debug(f"Circular reference detected for schema {schema_ref}")
                 return None
             visited.add(schema_ref)
 
-        # Resolve schema
-        if hasattr(schema, "ref") and schema.ref:
-            schema_name = schema.ref.split("/")[-1]
+            schema_name = schema_ref.split("/")[-1]
             resolved_schema = api.components.schemas[schema_name]
         else:
             schema_name = "inline"
@@ -322,11 +704,11 @@ class Spec:
             all_schemas = cls.handle_all_of(
                 resolved_schema.allOf, api, depth, max_depth, visited
             )
-            return Schema(
+            return Schema.model_construct(
                 name=schema_name,
                 type="object",
                 properties=[
-                    Schema(
+                    Schema.model_construct(
                         name="all_of",
                         type="object",
                         properties=[prop for p in all_schemas for prop in p.properties],
@@ -340,11 +722,11 @@ class Spec:
             any_of_schemas = cls.handle_any_of(
                 resolved_schema.anyOf, api, depth, max_depth, visited
             )
-            return Schema(
+            return Schema.model_construct(
                 name=schema_name,
                 type="object",
                 properties=[
-                    Schema(
+                    Schema.model_construct(
                         name="any_of",
                         type=[p.type for p in any_of_schemas],
                         description=resolved_schema.description,
@@ -356,21 +738,25 @@ class Spec:
         # Handle array type
         elif resolved_schema.type == "array":
             if not resolved_schema.items:
-                return Schema(name=schema_name, type="array", properties=[], default=[])
+                return Schema.model_construct(
+                    name=schema_name, type="array", properties=[], default=[]
+                )
 
             processed_items = cls._process_schema(
                 resolved_schema.items, api, depth + 1, max_depth, visited
             )
             if not processed_items:
-                return Schema(name=schema_name, type="array", properties=[], default=[])
+                return Schema.model_construct(
+                    name=schema_name, type="array", properties=[], default=[]
+                )
 
             properties.append(
-                Schema(
+                Schema.model_construct(
                     name="inline",
                     type="array",
                     description=resolved_schema.description,
                     default=[],
-                    items=Schema(
+                    items=Schema.model_construct(
                         name="item",
                         type=resolved_schema.items.type or "object",
                         properties=processed_items.properties,
@@ -383,94 +769,101 @@ class Spec:
         elif resolved_schema.properties:
             for prop_name, prop_schema in resolved_schema.properties.items():
                 prop_type = prop_schema.type or "object"
-                prop = Schema(
-                    name=prop_name, type=prop_type, description=prop_schema.description
-                )
+                prop_fields = {
+                    "name": prop_name,
+                    "type": prop_type,
+                    "description": prop_schema.description,
+                }
                 if prop_type == "array" and prop_schema.items:
-                    prop.items = cls._process_array_items(
+                    prop_fields["items"] = cls._process_array_items(
                         prop_schema.items, api, depth, max_depth, visited
                     )
-                    prop.default = []
+                    prop_fields["default"] = []
                 elif prop_type == "object":
                     if (
                         prop_schema.anyOf
                         or prop_schema.allOf
-                        or (hasattr(prop_schema, "ref") and prop_schema.ref)
+                        or getattr(prop_schema, "ref", None)
                     ):
                         # For allOf/anyOf/ref we want to inline the properties
                         nested_schema = cls._process_schema(
                             prop_schema, api, depth, max_depth, visited
                         )
                         if nested_schema and nested_schema.properties:
-                            prop = Schema(
-                                name=prop_name,
-                                type=nested_schema.properties[0].type,
-                                description=prop_schema.description,
-                                properties=[nested_schema.properties[0]],
-                                any_of=nested_schema.properties[0].any_of,
-                                all_of=nested_schema.properties[0].all_of,
+                            inlined = nested_schema.properties[0]
+                            prop_fields.update(
+                                type=inlined.type,
+                                properties=[inlined],
+                                any_of=inlined.any_of,
+                                all_of=inlined.all_of,
                             )
                     elif prop_schema.properties:
-                        prop.properties = cls._process_schema(
+                        prop_fields["properties"] = cls._process_schema(
                             prop_schema, api, depth, max_depth, visited
                         ).properties
 
-                properties.append(prop)
+                properties.append(Schema.model_construct(**prop_fields))
 
-        return Schema(
+        return Schema.model_construct(
             name=schema_name,
             type="object",
             properties=properties,
         )
 
     @classmethod
-    def _process_operation(cls, path_name, operation, api) -> Operation:
+    def _process_operation(
+        cls, path_name, operation, api, schema_cache=None
+    ) -> Operation:
         """Process operation and return an Operation model."""
         processed_params = []
         for param in operation.parameters:
-            param_dict = {
-                "name": param.name,
-                "in": param.in_,
-                "required": bool(getattr(param, "required", False)),
-                "description": getattr(param, "description", None),
-                "deprecated": getattr(param, "deprecated", None),
-                "allowEmptyValue": getattr(param, "allowEmptyValue", None),
-                "style": getattr(param, "style", None),
-                "explode": getattr(param, "explode", None),
-                "allowReserved": getattr(param, "allowReserved", None),
-                "type": param.schema_.type,
-            }
-
-            # Add enum and default if they exist in the schema
-            if param.schema_.enum:
-                param_dict["enum"] = param.schema_.enum
-                param_dict["required"] = True
-            if param.schema_.default:
-                param_dict["default"] = param.schema_.default
+            # aiopenapi3 parameters are pydantic models, so every field is
+            # present and can be read as a plain attribute
+            param_schema = param.schema_
+            enum = param_schema.enum or None
+            default = param_schema.default or None
 
             # Add array sub-type information if needed.
             # FIXME: May need support for nested types.
-            if hasattr(param.schema_, "items") and param.schema_.items:
-                param_dict["items"] = Schema(
+            items = getattr(param_schema, "items", None)
+            if items:
+                items = Schema.model_construct(
                     name="item",
-                    type=param.schema_.items.type or "object",
+                    type=items.type or "object",
                 )
-                param_dict["default"] = []
-
-            processed_params.append(Parameter(**param_dict))
+                default = []
+
+            processed_params.append(
+                Parameter.model_construct(
+                    name=param.name,
+                    in_=param.in_,
+                    # Parameters restricted to an enum are always required
+                    required=bool(param.required) or enum is not None,
+                    description=param.description,
+                    deprecated=param.deprecated,
+                    allowEmptyValue=param.allowEmptyValue,
+                    style=param.style,
+                    explode=param.explode,
+                    allowReserved=param.allowReserved,
+                    type=param_schema.type,
+                    enum=enum,
+                    default=default,
+                    items=items or None,
+                )
+            )
 
         processed_responses = {}
         for status_code, response in operation.responses.items():
             schema = None
             format = "text/plain"
-            if response.content and "application/json" in response.content:
+            json_content = _json_media_type(response.content)
+            if json_content is not None:
                 schema = cls._process_schema(
-                    response.content["application/json"].schema_, api
+                    json_content[1].schema_, api, schema_cache=schema_cache
                 )
                 format = "application/json"
-            processed_responses[status_code] = Response(
+            processed_responses[status_code] = Response.model_construct(
                 description=response.description,
-                content=response.content,
                 schema_=schema,
                 format=format,
             )
@@ -482,17 +875,16 @@ class Spec:
             encoding = None
             content_type = None
 
+            body_content = operation.requestBody.content or {}
+            content = body_content.get("application/x-www-form-urlencoded")
+
             # Handle form-encoded content
-            if (
-                operation.requestBody.content
-                and "application/x-www-form-urlencoded" in operation.requestBody.content
-            ):
-                content = operation.requestBody.content[
-                    "application/x-www-form-urlencoded"
-                ]
+            if content is not None:
                 content_type = "application/x-www-form-urlencoded"
                 if content.schema_:
-                    schema = cls._process_schema(content.schema_, api)
+                    schema = cls._process_schema(
+                        content.schema_, api, schema_cache=schema_cache
+                    )
                 if content.encoding:
                     # Convert encoding object to dictionary
                     encoding = {}
@@ -505,27 +897,23 @@ class Spec:
                             ),
                             "contentType": getattr(encoding_obj, "contentType", None),
                         }
-            # Handle JSON content
-            elif (
-                operation.requestBody.content
-                and "application/json" in operation.requestBody.content
-            ):
-                content_schema = operation.requestBody.content[
-                    "application/json"
-                ].schema_
-                schema = cls._process_schema(content_schema, api)
-                content_type = "application/json"
-
-            request_body = RequestBody(
+            # Handle JSON content, keeping vendor types (e.g. application/merge-patch+json)
+            # so the proxy can send the Content-Type the endpoint expects
+            elif (json_content := _json_media_type(body_content)) is not None:
+                content_type, content = json_content
+                schema = cls._process_schema(
+                    content.schema_, api, schema_cache=schema_cache
+                )
+
+            request_body = RequestBody.model_construct(
                 description=getattr(operation.requestBody, "description", None),
-                content=operation.requestBody.content,
                 required=bool(getattr(operation.requestBody, "required", False)),
                 schema_=schema,
                 encoding=encoding,
                 content_type=content_type,
             )
 
-        return Operation(
+        return Operation.model_construct(
             id=operation.operationId or path_name,
             summary=operation.summary,
             description=operation.description,
@@ -535,119 +923,83 @@ class Spec:
         )
 
     def __repr__(self) -> str:
-        output = []
+        def _repr_sub_schemas(
+            label: str, sub_schemas: List[Schema], prop: Schema, indent: str
+        ) -> Iterator[str]:
+            """Helper function to yield the allOf/anyOf members of a property."""
+            yield f"{indent}{" " * 4}{label}:"
+            for sub_schema in sub_schemas:
+                yield f"{indent}{" " * 6}- Type: {sub_schema.type}"
+                if sub_schema.properties:
+                    yield f"{indent}{" " * 8}Properties:"
+                    for prop in sub_schema.properties:
+                        yield f"{indent}{" " * 10}- {prop.name}: {prop.type}"
+                        if prop.items:
+                            yield f"{indent}{" " * 12}Items: {prop.items.name}"
+                            if prop.items.properties:
+                                yield f"{indent}{" " * 14}Properties:"
+                                for item_prop in prop.items.properties:
+                                    yield f"{indent}{" " * 16}- {item_prop.name}: {item_prop.type}"
+                elif prop.properties:
+                    yield f"{indent}{" " * 12}Properties:"
+                    for nested_prop in prop.properties:
+                        yield f"{indent}{" " * 14}- {nested_prop.name}: {nested_prop.type}"
 
-        def _repr_schema(schema: Schema, indent: str = "") -> str:
-            """Helper function to format schema details recursively."""
-            output = []
+        def _repr_schema(schema: Schema, indent: str = "") -> Iterator[str]:
+            """Helper function to yield schema details line by line."""
             # Handle regular properties
-            output.append(f"{indent}Properties:")
+            yield f"{indent}Properties:"
             for prop in schema.properties:
-                output.append(f"{indent}  - {prop.name}: {prop.type}")
+                yield f"{indent}  - {prop.name}: {prop.type}"
                 if prop.all_of:
-                    output.append(f"{indent}{" " * 4}All of:")
-                    for sub_schema in prop.all_of:
-                        output.append(f"{indent}{" " * 6}- Type: {sub_schema.type}")
-                        if sub_schema.properties:
-                            output.append(f"{indent}{" " * 8}Properties:")
-                            for prop in sub_schema.properties:
-                                output.append(
-                                    f"{indent}{" " * 10}- {prop.name}: {prop.type}"
-                                )
-                                if prop.items:
-                                    output.append(
-                                        f"{indent}{" " * 12}Items: {prop.items.name}"
-                                    )
-                                    if prop.items.properties:
-                                        output.append(f"{indent}{" " * 14}Properties:")
-                                        for item_prop in prop.items.properties:
-                                            output.append(
-                                                f"{indent}{" " * 16}- {item_prop.name}: {item_prop.type}"
-                                            )
-                        elif prop.properties:
-                            output.append(f"{indent}{" " * 12}Properties:")
-                            for nested_prop in prop.properties:
-                                output.append(
-                                    f"{indent}{" " * 14}- {nested_prop.name}: {nested_prop.type}"
-                                )
+                    yield from _repr_sub_schemas("All of", prop.all_of, prop, indent)
                 elif prop.any_of:
-                    output.append(f"{indent}{" " * 4}Any of:")
-                    for sub_schema in prop.any_of:
-                        output.append(f"{indent}{" " * 6}- Type: {sub_schema.type}")
-                        if sub_schema.properties:
-                            output.append(f"{indent}{" " * 8}Properties:")
-                            for prop in sub_schema.properties:
-                                output.append(
-                                    f"{indent}{" " * 10}- {prop.name}: {prop.type}"
-                                )
-                                if prop.items:
-                                    output.append(
-                                        f"{indent}{" " * 12}Items: {prop.items.name}"
-                                    )
-                                    if prop.items.properties:
-                                        output.append(f"{indent}{" " * 14}Properties:")
-                                        for item_prop in prop.items.properties:
-                                            output.append(
-                                                f"{indent}{" " * 16}- {item_prop.name}: {item_prop.type}"
-                                            )
-                        elif prop.properties:
-                            output.append(f"{indent}{" " * 12}Properties:")
-                            for nested_prop in prop.properties:
-                                output.append(
-                                    f"{indent}{" " * 14}- {nested_prop.name}: {nested_prop.type}"
-                                )
+                    yield from _repr_sub_schemas("Any of", prop.any_of, prop, indent)
                 elif prop.items:
-                    output.append(f"{indent}{" " * 4}Items: {prop.items.name}")
+                    yield f"{indent}{" " * 4}Items: {prop.items.name}"
                     if prop.items.properties:
-                        output.append(f"{indent}{" " * 4}Properties:")
+                        yield f"{indent}{" " * 4}Properties:"
                         for item_prop in prop.items.properties:
-                            output.append(
-                                f"{indent}{" " * 6}- {item_prop.name}: {item_prop.type}"
-                            )
+                            yield f"{indent}{" " * 6}- {item_prop.name}: {item_prop.type}"
                 elif prop.properties:
-                    output.append(f"{indent}{" " * 4}Properties:")
+                    yield f"{indent}{" " * 4}Properties:"
                     for nested_prop in prop.properties:
-                        output.append(
-                            f"{indent}{" " * 6}- {nested_prop.name}: {nested_prop.type}"
-                        )
-
-            return "\n".join(output)
-
-        for path in self.paths:
-            if path.get:
-                output.append(f"GET: {path.get.summary}")
-                output.append("Parameters:")
-                for param in path.get.parameters:
-                    output.append(f"  - {param.name} ({param.in_})")
-                output.append("Responses:")
-                for status_code, response in path.get.responses.items():
-                    output.append(f"  - {status_code}: {response.description}")
-                    if response.schema_:
-                        output.append(f"    Schema: {response.schema_.name}")
-                        output.append(_repr_schema(response.schema_, "    "))
-
-            for method, operation in [
-                ("POST", path.post),
-                ("PUT", path.put),
-                ("DELETE", path.delete),
-                ("PATCH", path.patch),
-            ]:
-                if operation:
-                    output.append(f"{method}: {operation.summary}")
-                    if operation.request_body_:
-                        output.append("Request body:")
-                        if operation.request_body_.schema_:
-                            output.append(
-                                f"  Schema: {operation.request_body_.schema_.name}"
-                            )
-                            output.append(
-                                _repr_schema(operation.request_body_.schema_, "  ")
-                            )
-                    output.append("Responses:")
-                    for status_code, response in operation.responses.items():
-                        output.append(f"  - {status_code}: {response.description}")
+                        yield f"{indent}{" " * 6}- {nested_prop.name}: {nested_prop.type}"
+
+        def _repr_lines() -> Iterator[str]:
+            for path in self.paths:
+                if path.get:
+                    yield f"GET: {path.get.summary}"
+                    yield "Parameters:"
+                    for param in path.get.parameters:
+                        yield f"  - {param.name} ({param.in_})"
+                    yield "Responses:"
+                    for status_code, response in path.get.responses.items():
+                        yield f"  - {status_code}: {response.description}"
                         if response.schema_:
-                            output.append(f"    Schema: {response.schema_.name}")
-                            output.append(_repr_schema(response.schema_, "    "))
-
-        return "\n".join(output)
+                            yield f"    Schema: {response.schema_.name}"
+                            yield from _repr_schema(response.schema_, "    ")
+
+                for method, operation in [
+                    ("POST", path.post),
+                    ("PUT", path.put),
+                    ("DELETE", path.delete),
+                    ("PATCH", path.patch),
+                ]:
+                    if operation:
+                        yield f"{method}: {operation.summary}"
+                        if operation.request_body_:
+                            yield "Request body:"
+                            if operation.request_body_.schema_:
+                                yield f"  Schema: {operation.request_body_.schema_.name}"
+                                yield from _repr_schema(
+                                    operation.request_body_.schema_, "  "
+                                )
+                        yield "Responses:"
+                        for status_code, response in operation.responses.items():
+                            yield f"  - {status_code}: {response.description}"
+                            if response.schema_:
+                                yield f"    Schema: {response.schema_.name}"
+                                yield from _repr_schema(response.schema_, "    ")
+
+        return "\n".join(_repr_lines())
@@ -6,8 +6,33 @@ from starlette.requests import Request
 # 3p
 import httpx
 
+try:
+    import h2  # noqa: F401
+except ImportError:  # optional, enables HTTP/2 to upstream APIs
+    h2 = None
+
 log = logging.getLogger(__name__)
 
+# Connection pool limits for the default upstream client. Idle connections are
+# kept longer than httpx's 5s default so gaps between tool calls don't force
+# a new TCP/TLS handshake.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=100, keepalive_expiry=30.0
+)
+
+
+def _default_client() -> httpx.AsyncClient:
+    """Build the pooled client used when no client_builder is given."""
+    # No timeout unless MCPProxy.timeout is set, which is applied to the client
+    return httpx.AsyncClient(limits=DEFAULT_LIMITS, http2=h2 is not None, timeout=None)
+
+
+def _drop_none(values: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Return values without None entries, only copying when there are some."""
+    if not values or None not in values.values():
+        return values
+    return {k: v for k, v in values.items() if v is not None}
+
 
 class MCPProxy:
     """A class to intercept and record HTTP requests made through httpx clients."""
@@ -24,13 +49,72 @@ class MCPProxy:
         Args:
             forward_headers: List of headers to forward from the request to the server
             forward_query_params: Dict header name -> query param name to forward from the request to the server
-            client_builder: Function that returns an AsyncClient. Defaults to creating a new httpx.AsyncClient
+            client_builder: Function that returns an AsyncClient. Defaults to a pooled httpx.AsyncClient, using HTTP/2 when h2 is installed.
+                It's called once, on the first request, and the client is reused until aclose()
+            timeout: Upstream timeout in seconds, set on the client. None leaves a newly built client's own timeout;
+                setting it back to None once the client exists disables the timeout
         """
         self.forward_headers = forward_headers
         self.forward_query_params = forward_query_params
-        self.client_builder = client_builder or (lambda: httpx.AsyncClient())
+        self.client_builder = client_builder or _default_client
+        self._client: Optional[httpx.AsyncClient] = None
+        self._closed = False
         self.timeout = timeout
 
+    @property
+    def forward_headers(self) -> Optional[List[str]]:
+        return self._forward_headers
+
+    @forward_headers.setter
+    def forward_headers(self, value: Optional[List[str]]) -> None:
+        self._forward_headers = value
+        # Raw ASGI header names are lowercase bytes; map them to configured names
+        self._forward_header_names = {
+            header.lower().encode("latin-1"): header for header in value or ()
+        }
+
+    @property
+    def forward_query_params(self) -> Optional[Dict[str, str]]:
+        return self._forward_query_params
+
+    @forward_query_params.setter
+    def forward_query_params(self, value: Optional[Dict[str, str]]) -> None:
+        self._forward_query_params = value
+        self._forward_query_param_names = {
+            header.lower().encode("latin-1"): query_param
+            for header, query_param in (value or {}).items()
+        }
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value: Optional[float]) -> None:
+        self._timeout = value
+        # Set once on the client rather than passed with every request. Going back
+        # to None on a live client disables its timeout, matching the property.
+        if self._client is not None:
+            self._client.timeout = httpx.Timeout(value)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, building it on first use."""
+        if self._closed:
+            # Rebuilding here would leave a client that nothing closes
+            raise RuntimeError("MCPProxy is closed")
+        if self._client is None:
+            self._client = self.client_builder()
+            if self._timeout is not None:
+                self._client.timeout = self._timeout
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared client, if one was built. The proxy can't be used afterwards."""
+        self._closed = True
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
     async def do_request(
         self,
         request: Request,
@@ -39,6 +123,7 @@ class MCPProxy:
         params: Optional[Dict[str, Any]] = None,
         form_data: Optional[Dict[str, Any]] = None,
         json_body: Optional[Dict[str, Any]] = None,
+        json_content_type: Optional[str] = None,
     ) -> httpx.Response:
         """Execute an HTTP request.
 
@@ -48,52 +133,59 @@ class MCPProxy:
             params: Query parameters
             form_data: Form data
             json_body: JSON body data
+            json_content_type: Content-Type for the JSON body, e.g. application/merge-patch+json
 
         Returns:
             The httpx Response object
         """
-        # Pass along any headers that were set in the server config
+        # Pass along any headers that were set in the server config, and
+        # forward others to query params, in a single pass over the raw headers
         request_headers = {}
-        if self.forward_headers:
-            for header in self.forward_headers:
-                if header in request.headers:
-                    request_headers[header] = request.headers[header]
-
-        # Forward from headers to query params
+        forward_header_names = self._forward_header_names
+        forward_query_param_names = self._forward_query_param_names
         if self.forward_query_params:
             params = params or {}
-            for header_name, query_param_name in self.forward_query_params.items():
-                if header_name in request.headers.keys():
-                    params[query_param_name] = request.headers[header_name]
+        if forward_header_names or forward_query_param_names:
+            seen = set()
+            for name, value in request.headers.raw:
+                # Like Headers.get, only the first value of a repeated header counts
+                if name in seen:
+                    continue
+                seen.add(name)
+                header = forward_header_names.get(name)
+                if header is not None:
+                    request_headers[header] = value.decode("latin-1")
+                query_param_name = forward_query_param_names.get(name)
+                if query_param_name is not None:
+                    params[query_param_name] = value.decode("latin-1")
 
         # Filter out None values
-        if params:
-            params = {k: v for k, v in params.items() if v is not None}
-        if json_body:
-            json_body = {k: v for k, v in json_body.items() if v is not None}
-        if form_data:
-            form_data = {k: v for k, v in form_data.items() if v is not None}
+        params = _drop_none(params)
+        json_body = _drop_none(json_body)
+        form_data = _drop_none(form_data)
+
+        if json_body and json_content_type:
+            # Send the media type the spec declared rather than httpx's application/json
+            request_headers = {
+                k: v for k, v in request_headers.items() if k.lower() != "content-type"
+            }
+            request_headers["Content-Type"] = json_content_type
 
         # Log the request
         log.info(f"Making {method} request to {url}")
-        if params:
-            log.debug(f"Query parameters: {params}")
-        if json_body:
-            log.debug(f"Request body: {json_body}")
-
-        # Make the actual request using the provided client builder
-        client = self.client_builder()
-        try:
-            response = await client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_body,
-                data=form_data,
-                headers=request_headers,
-                timeout=self.timeout,
-            )
-        finally:
-            await client.aclose()
+        # Skip formatting potentially large payloads unless they'll be logged
+        if log.isEnabledFor(logging.DEBUG):
+            if params:
+                log.debug(f"Query parameters: {params}")
+            if json_body:
+                log.debug(f"Request body: {json_body}")
 
-        return response
+        # Make the actual request on the shared client so connections are reused
+        return await self._get_client().request(
+            method=method,
+            url=url,
+            params=params,
+            json=json_body,
+            data=form_data,
+            headers=request_headers,
+        )
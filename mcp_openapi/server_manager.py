@@ -1,35 +1,90 @@
 # stdlib
+import asyncio
+import contextlib
+import json
 import logging
 import sys
 import yaml
-from typing import Dict, AsyncIterator
+from typing import Any, Dict, AsyncIterator, Optional
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
 # 3p
 from starlette.applications import Starlette
 from starlette.routing import Route
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import orjson
+except ImportError:  # optional, faster JSON for the HTTP endpoints
+    orjson = None
+
 # project
 from mcp_openapi.parser import Spec
 from mcp_openapi.tools import (
     tools_from_spec,
     Tool,
-    create_tool_function_exec,
+    create_tool_function_noexec,
 )
 from mcp_openapi.proxy import MCPProxy
 
 
 log = logging.getLogger(__name__)
 
+# Timeout in seconds for each warm-up request to an upstream API
+WARM_UP_TIMEOUT = 5.0
+
+# Seconds a proxy for a namespace dropped from the config stays open, so sessions
+# still connected to it can finish, before its pooled client is closed
+RETIRED_PROXY_GRACE = 60.0
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _render_json(content: Any) -> bytes:
+    """Encode content for a JSON response, using orjson when it's installed."""
+    if orjson:
+        return orjson.dumps(content)
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class _JSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return _render_json(content)
+
+
+def _tool_payload(tool: Tool) -> dict:
+    return {
+        "name": tool.name,
+        "description": tool.description,
+        "parameters": [
+            param.model_dump(exclude={"request_body_field"})
+            for param in tool.all_params()
+        ],
+    }
+
 
 class ServerManager:
     def __init__(self, config_path: str = "servers.yaml"):
         self.config_path = config_path
         self.servers: Dict[str, FastMCP] = {}
         self.tools: Dict[str, list[Tool]] = {}
+        self.proxies: Dict[str, MCPProxy] = {}
+        # Delayed closes of proxies whose namespace was removed from the config
+        self._retiring: set[asyncio.Task] = set()
+        # Tools don't change once a server is started, so the /tools payload is built
+        # at registration and the encoded body is reused until the tools change
+        self._tools_payload: Dict[str, list[dict]] = {}
+        self._all_tools_body: Optional[bytes] = None
+        self._namespace_tools_body: Dict[str, bytes] = {}
         self.routes = []
         self.setup_endpoints()
         self.load_config()
@@ -38,34 +93,19 @@ class ServerManager:
         """Set up Starlette endpoints"""
 
         async def get_all_tools(request):
-            tools_by_namespace = {}
-            for namespace, tools in self.tools.items():
-                tools_by_namespace[namespace] = [
-                    {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": [
-                            param.model_dump(exclude={"request_body_field"})
-                            for param in tool.all_params()
-                        ],
-                    }
-                    for tool in tools
-                ]
-            return JSONResponse(content=tools_by_namespace)
+            if self._all_tools_body is None:
+                self._all_tools_body = _render_json(self._tools_payload)
+            return Response(self._all_tools_body, media_type="application/json")
 
         async def get_namespace_tools(request):
             namespace = request.path_params["namespace"]
-            if namespace not in self.tools:
-                return JSONResponse(
+            body = self._namespace_tools_body.get(namespace)
+            if body is None:
+                return _JSONResponse(
                     content={"error": f"Namespace '{namespace}' not found"},
                     status_code=404,
                 )
-            return JSONResponse(
-                content=[
-                    {"name": tool.name, "description": tool.description}
-                    for tool in self.tools[namespace]
-                ]
-            )
+            return Response(body, media_type="application/json")
 
         self.routes.extend(
             [
@@ -78,7 +118,7 @@ class ServerManager:
         """Load and parse the servers configuration file."""
         try:
             with open(self.config_path, "r") as f:
-                self.config = yaml.safe_load(f)
+                self.config = yaml.load(f, Loader=YAML_LOADER)
         except Exception as e:
             log.error(f"Failed to load config file {self.config_path}: {e}")
             sys.exit(1)
@@ -87,6 +127,46 @@ class ServerManager:
         """Start all configured servers."""
         for server_config in self.config["servers"]:
             await self.start_server(server_config)
+        self._retire_removed_proxies()
+
+    async def warm_up(self):
+        """Open a connection to each upstream API so the first tool call skips DNS and TLS.
+
+        Failures are ignored; the upstream is simply contacted again on first use.
+        """
+
+        async def warm(proxy: MCPProxy, base_url: str):
+            with contextlib.suppress(Exception):
+                await proxy._get_client().head(base_url, timeout=WARM_UP_TIMEOUT)
+
+        await asyncio.gather(
+            *(
+                warm(
+                    self.proxies[server_config["namespace"]], server_config["base_url"]
+                )
+                for server_config in self.config["servers"]
+                if server_config["namespace"] in self.proxies
+                # Templated hosts are only known once a request supplies them
+                and "{" not in server_config["base_url"]
+            )
+        )
+
+    def _retire_removed_proxies(self):
+        """Schedule closing the proxies of namespaces no longer in the config."""
+        namespaces = {
+            server_config["namespace"] for server_config in self.config["servers"]
+        }
+        for namespace in [n for n in self.proxies if n not in namespaces]:
+            log.info(f"Closing proxy for removed namespace {namespace}")
+            task = asyncio.create_task(self._close_later(self.proxies.pop(namespace)))
+            self._retiring.add(task)
+            task.add_done_callback(self._retiring.discard)
+
+    async def _close_later(self, proxy: MCPProxy):
+        try:
+            await asyncio.sleep(RETIRED_PROXY_GRACE)
+        finally:
+            await proxy.aclose()
 
     async def start_server(self, server_config: dict):
         """Start a single server based on its configuration."""
@@ -101,29 +181,36 @@ class ServerManager:
         log.info(f"Starting server for {name} ({namespace})")
 
         try:
-            spec = (
-                Spec.from_file(url[7:], paths)
-                if url.startswith("file://")
-                else Spec.from_url(url, paths)
-            )
+            # Fetching and parsing a spec can take seconds, so do it off the event
+            # loop to keep existing sessions responsive during a reload
+            if url.startswith("file://"):
+                spec = await asyncio.to_thread(Spec.from_file, url[7:], paths)
+            else:
+                spec = await asyncio.to_thread(Spec.from_url, url, paths)
 
             @dataclass
             class AppContext:
                 base_url: str
                 proxy: MCPProxy
 
+            # One proxy per namespace, shared by all sessions so upstream
+            # connections are pooled for the life of the server. It's kept across
+            # reloads since sessions on the previous app may still be using it.
+            proxy = self.proxies.get(namespace)
+            if proxy is None:
+                proxy = MCPProxy(
+                    forward_headers=forward_headers,
+                    forward_query_params=forward_query_params,
+                )
+                self.proxies[namespace] = proxy
+            else:
+                proxy.forward_headers = forward_headers
+                proxy.forward_query_params = forward_query_params
+
             @asynccontextmanager
             async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
                 """Manage application lifecycle with type-safe context"""
-                try:
-                    # Create recorder with namespace-specific cassette directory
-                    proxy = MCPProxy(
-                        forward_headers=forward_headers,
-                        forward_query_params=forward_query_params,
-                    )
-                    yield AppContext(base_url=base_url, proxy=proxy)
-                finally:
-                    pass
+                yield AppContext(base_url=base_url, proxy=proxy)
 
             mcp = FastMCP(
                 name,
@@ -134,9 +221,14 @@ class ServerManager:
 
             tools = tools_from_spec(spec, forward_query_params.keys())
             self.tools[namespace] = tools
+            self._tools_payload[namespace] = [_tool_payload(tool) for tool in tools]
+            self._all_tools_body = None
+            self._namespace_tools_body[namespace] = _render_json(
+                [{"name": tool.name, "description": tool.description} for tool in tools]
+            )
 
             for tool in tools:
-                fn = create_tool_function_exec(tool)
+                fn = create_tool_function_noexec(tool)
                 mcp.tool(
                     name=tool.name,
                     description=tool.description,
@@ -159,9 +251,21 @@ class ServerManager:
         for namespace, server in self.servers.items():
             log.info(f"Stopping server for {namespace}")
 
+        # Proxies stay open: live sessions keep using them until they end, and
+        # start_server reuses them. Those of removed namespaces are closed by
+        # start_servers after a grace period, the rest by aclose() on shutdown.
         self.servers.clear()
         self.routes = []
 
+    async def aclose(self):
+        """Close the upstream clients of every proxy, including retiring ones."""
+        for task in self._retiring:
+            task.cancel()
+        await asyncio.gather(*self._retiring, return_exceptions=True)
+        for proxy in self.proxies.values():
+            await proxy.aclose()
+        self.proxies.clear()
+
     def get_app(self) -> Starlette:
         """Get the Starlette application with all routes."""
         return Starlette(routes=self.routes)
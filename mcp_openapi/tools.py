@@ -1,8 +1,11 @@
 # stdlib
 import re
+import inspect
+from functools import lru_cache
 from typing import Any, Union, Callable
 from collections import defaultdict
 from itertools import chain
+from operator import attrgetter
 
 # 3p
 from pydantic import BaseModel
@@ -17,6 +20,29 @@ from mcp.server.fastmcp import Context  # noqa: F401
 # Maximum number of characters to include in enum descriptions
 MAX_ENUM_DESCRIPTION_LENGTH = 100
 
+# OpenAPI scalar types and the Python types used for them in tool signatures
+PYTHON_TYPES = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+}
+
+# (HTTP method, Path attribute) for each operation a path can have
+OPERATION_METHODS = tuple((method.upper(), method) for method in parser.HTTP_METHODS)
+
+# Position before every uppercase letter except a leading one
+CAMEL_CASE_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@lru_cache(maxsize=4096)
+def _snake_case(name: str) -> str:
+    """Convert camelCase to snake_case; operation ids and param names repeat a lot."""
+    # Most names in a spec are already lowercase, so skip the regex entirely
+    if name.islower():
+        return name
+    return CAMEL_CASE_BOUNDARY.sub("_", name).lower()
+
 
 class ToolParameter(BaseModel):
     name: str
@@ -51,7 +77,7 @@ class Tool(BaseModel):
         operation: parser.Operation,
         exclude_params: list[str] = None,
     ) -> "Tool":
-        exclude_params = exclude_params or []
+        exclude_params = frozenset(exclude_params or ())
 
         seen_params = set()
         query_params = []
@@ -59,7 +85,12 @@ class Tool(BaseModel):
 
         # Ensure array types come first with reversed sorting,
         # so we always pick the array name + type over the regular.
-        for param in reversed(sorted(operation.parameters, key=lambda x: x.name)):
+        # Sorting the reversed list keeps the last of any same-named params first.
+        for param in sorted(
+            reversed(operation.parameters), key=attrgetter("name"), reverse=True
+        ):
+            if param.name in exclude_params:
+                continue
             dedup_name = cls._to_dedupe_name(param.name)
             if dedup_name in seen_params:
                 continue
@@ -75,11 +106,8 @@ class Tool(BaseModel):
                     )
                 description = f"{description}{enum_desc}".strip()
 
-            if param.name in exclude_params:
-                continue
-
             query_params.append(
-                ToolParameter(
+                ToolParameter.model_construct(
                     name=cls._to_python_arg(param.name),
                     type=cls._to_python_type(param),
                     description=cls._to_python_description(description),
@@ -101,13 +129,15 @@ class Tool(BaseModel):
                             descriptions.append(
                                 f"Object with properties: {', '.join(p.name for p in any_of.properties)}"
                             )
+                        elif isinstance(any_of.type, list):
+                            descriptions.append(" or ".join(map(str, any_of.type)))
                         elif any_of.type:
                             descriptions.append(any_of.type)
                     description = (
                         f"{param.description}, one of: ({') OR ('.join(descriptions)})"
                     )
                     by_content_type[operation.request_body_.content_type].append(
-                        ToolParameter(
+                        ToolParameter.model_construct(
                             name=param.name,
                             type=cls._to_python_type(param),
                             description=cls._to_python_description(description),
@@ -123,7 +153,7 @@ class Tool(BaseModel):
                             by_content_type[
                                 operation.request_body_.content_type
                             ].append(
-                                ToolParameter(
+                                ToolParameter.model_construct(
                                     name=f"{param.name}_{p.name}",
                                     type=cls._to_python_type(p),
                                     description=cls._to_python_description(
@@ -138,7 +168,7 @@ class Tool(BaseModel):
                     pass
                 else:
                     by_content_type[operation.request_body_.content_type].append(
-                        ToolParameter(
+                        ToolParameter.model_construct(
                             name=param.name,
                             type=cls._to_python_type(param),
                             description=cls._to_python_description(param.description),
@@ -146,17 +176,26 @@ class Tool(BaseModel):
                             default=param.default,
                         )
                     )
-        return cls(
+        # Everything here comes from already-validated parser models, so the
+        # tool models are built without re-running validation
+        return cls.model_construct(
             name=cls._to_fn_name(operation.id),
             description=cls._to_python_description(
                 operation.summary or operation.description or ""
             ),
             query_params=query_params,
-            body_by_content_type=by_content_type,
+            body_by_content_type=dict(by_content_type),
             method=method_name,
             path=path,
         )
 
+    def json_content_type(self) -> str | None:
+        """Return the media type of the JSON request body, if the tool has one."""
+        for content_type in self.body_by_content_type or ():
+            if content_type != "application/x-www-form-urlencoded":
+                return content_type
+        return None
+
     def all_params(self) -> list[ToolParameter]:
         if not self.body_by_content_type:
             return self.query_params
@@ -166,19 +205,7 @@ class Tool(BaseModel):
 
     @classmethod
     def _to_snake_case(cls, name: str) -> str:
-        if not name:
-            return name
-
-        result = [name[0].lower()]
-
-        for char in name[1:]:
-            if char.isupper():
-                result.append("_")
-                result.append(char.lower())
-            else:
-                result.append(char)
-
-        return "".join(result)
+        return _snake_case(name)
 
     @classmethod
     def _to_dedupe_name(cls, name: str) -> str:
@@ -210,7 +237,6 @@ class Tool(BaseModel):
 
     @classmethod
     def _to_python_type(cls, param: Union[parser.Parameter, parser.Schema]) -> str:
-        py_type = "str"
         if (
             isinstance(param, parser.Parameter)
             and param.schema_
@@ -220,45 +246,26 @@ class Tool(BaseModel):
             types = []
             for schema in param.schema_["oneOf"]:
                 t = schema.get("type")
-                if t == "string":
-                    types.append("str")
-                elif t == "integer":
-                    types.append("int")
-                elif t == "number":
-                    types.append("float")
-                elif t == "boolean":
-                    types.append("bool")
-                else:
-                    types.append("Any")
+                # Raw schemas can list several types, which aren't mapped
+                types.append(
+                    PYTHON_TYPES.get(t, "Any") if isinstance(t, str) else "Any"
+                )
             return f"Union[{', '.join(types)}]"
         elif isinstance(param.type, list):
             # Handle anyOf types by creating a Union type
-            types = []
-            for t in param.type:
-                if t == "string":
-                    types.append("str")
-                elif t == "integer":
-                    types.append("int")
-                elif t == "number":
-                    types.append("float")
-                elif t == "boolean":
-                    types.append("bool")
-                else:
-                    types.append("Any")
+            # Members can themselves be type lists, e.g. OpenAPI 3.1's [string, "null"]
+            types = [
+                PYTHON_TYPES.get(t, "Any") if isinstance(t, str) else "Any"
+                for t in param.type
+            ]
             return f"Union[{', '.join(types)}]"
-        elif param.type == "string":
-            py_type = "str"
-        elif param.type == "integer":
-            py_type = "int"
-        elif param.type == "number":
-            py_type = "float"
-        elif param.type == "boolean":
-            py_type = "bool"
         elif param.type == "array":
             if param.items:
                 py_type = f"list[{cls._to_python_type(param.items)}]"
             else:
                 py_type = "list[Any]"
+        else:
+            py_type = PYTHON_TYPES.get(param.type, "str")
 
         if hasattr(param, "name") and param.name.endswith("[]"):
             py_type = f"list[{py_type}]"
@@ -267,15 +274,12 @@ class Tool(BaseModel):
 
 
 def tools_from_spec(spec: parser.Spec, forward_query_params: list[str]) -> list[Tool]:
+    # frozenset() of a frozenset is free, so from_operation doesn't copy this per operation
+    exclude_params = frozenset(forward_query_params)
     tools = []
     for path in spec.paths:
-        for method_name, operation in [
-            ("GET", path.get),
-            ("POST", path.post),
-            ("PUT", path.put),
-            ("DELETE", path.delete),
-            ("PATCH", path.patch),
-        ]:
+        for method_name, attr in OPERATION_METHODS:
+            operation = getattr(path, attr)
             if not operation:
                 continue
 
@@ -284,7 +288,7 @@ def tools_from_spec(spec: parser.Spec, forward_query_params: list[str]) -> list[
                     path.path,
                     method_name,
                     operation,
-                    exclude_params=forward_query_params,
+                    exclude_params=exclude_params,
                 )
             )
 
@@ -350,6 +354,7 @@ def get_tool_function_body(tool: Tool) -> str:
         params=params,
         form_data=form_data,
         json_body=json_body,
+        json_content_type={tool.json_content_type()!r},
     )
     return response.text"""
 
@@ -357,9 +362,98 @@ def get_tool_function_body(tool: Tool) -> str:
 def create_tool_function_exec(tool: Tool) -> Callable:
     """Create a tool function from a tool object. This uses exec() to create the function which
     is somewhat clunky but works with all the typing we want.
-    Note: There's a WIP version that's avoiding the exec() but not yet ready for use.
+    See create_tool_function_noexec() for the version used by the server.
     """
     # Execute the function definition
     local_vars = {}
     exec(get_tool_function_body(tool), globals(), local_vars)
     return local_vars[tool.name]
+
+
+# Names available to the type strings rendered by Tool._to_python_type
+_TYPE_NAMESPACE = {"Any": Any, "Union": Union}
+
+
+@lru_cache(maxsize=None)
+def _resolve_type(type_str: str) -> Any:
+    """Turn a rendered type string such as "list[str]" into the type itself."""
+    return eval(type_str, _TYPE_NAMESPACE)
+
+
+def create_tool_function_noexec(tool: Tool) -> Callable:
+    """Create a tool function from a tool object without generating any source.
+
+    The function is a closure over the tool with an explicit signature attached so FastMCP
+    sees the same parameters, types and Field defaults as create_tool_function_exec().
+    """
+    parameters = [
+        inspect.Parameter(
+            "ctx", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Context
+        )
+    ]
+    annotations = {"ctx": Context}
+    defaults = {}
+    for param in tool.all_params():
+        field_kwargs = {}
+        if param.description:
+            field_kwargs["description"] = param.description
+        annotation = _resolve_type(param.type)
+        defaults[param.name] = Field(**field_kwargs, default=param.default)
+        parameters.append(
+            inspect.Parameter(
+                param.name,
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                default=defaults[param.name],
+                annotation=annotation,
+            )
+        )
+        annotations[param.name] = annotation
+    annotations["return"] = dict
+    signature = inspect.Signature(parameters, return_annotation=dict)
+
+    query_names = tuple(p.name for p in tool.query_params)
+    form_fields = []
+    json_fields = []
+    for content_type, params in (tool.body_by_content_type or {}).items():
+        for param in params:
+            if content_type == "application/x-www-form-urlencoded":
+                form_fields.append((param.request_body_field, param.name))
+            else:
+                json_fields.append((param.request_body_field, param.name))
+    json_content_type = tool.json_content_type()
+    method = tool.method
+    path = tool.path
+
+    async def tool_function(ctx: Context, *args, **kwargs) -> dict:
+        if args or not kwargs.keys() <= defaults.keys():
+            # Positional or unknown arguments; let the signature map them (or raise)
+            bound = signature.bind(ctx, *args, **kwargs)
+            bound.apply_defaults()
+            values = bound.arguments
+        else:
+            # FastMCP always calls with keyword arguments
+            values = defaults | kwargs
+        lifespan_context = ctx.request_context.lifespan_context
+
+        params = {name: values[name] for name in query_names}
+        form_data = {field: values[name] for field, name in form_fields}
+        json_body = {}
+        for field, name in json_fields:
+            _set_body_field(field, json_body, values[name])
+
+        response = await lifespan_context.proxy.do_request(
+            request=ctx.request_context.request,
+            method=method,
+            url=f"{lifespan_context.base_url}{path}",
+            params=params,
+            form_data=form_data,
+            json_body=json_body,
+            json_content_type=json_content_type,
+        )
+        return response.text
+
+    tool_function.__name__ = tool_function.__qualname__ = tool.name
+    tool_function.__doc__ = tool.description
+    tool_function.__signature__ = signature
+    tool_function.__annotations__ = annotations
+    return tool_function
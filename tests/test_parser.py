@@ -5,7 +5,16 @@ import yaml
 import os
 from pathlib import Path
 
-from mcp_openapi.parser import Spec, Schema, RequestBody
+import aiopenapi3
+
+from mcp_openapi.parser import (
+    CACHE_DIR,
+    RequestBody,
+    Schema,
+    Spec,
+    _cache_key,
+    _path_matcher,
+)
 
 
 @pytest.fixture
@@ -689,6 +698,83 @@ def test_path_pattern_matching(tmp_path, sample_openapi_spec):
     assert get_op.parameters[0].required is True
 
 
+def test_from_file_memoizes_by_mtime(tmp_path, sample_openapi_spec):
+    spec_file = tmp_path / "openapi.json"
+    with open(spec_file, "w") as f:
+        json.dump(sample_openapi_spec, f)
+
+    spec = Spec.from_file(str(spec_file), ["/api/v1/users$"], base_path=tmp_path)
+    assert (
+        Spec.from_file(str(spec_file), ["/api/v1/users$"], base_path=tmp_path) is spec
+    )
+
+    # Editing the file invalidates both the in-process memo and the disk cache
+    sample_openapi_spec["paths"]["/api/v1/users"]["get"]["summary"] = "Edited"
+    with open(spec_file, "w") as f:
+        json.dump(sample_openapi_spec, f)
+    mtime = os.path.getmtime(spec_file)
+    os.utime(spec_file, (mtime + 10, mtime + 10))
+    edited = Spec.from_file(str(spec_file), ["/api/v1/users$"], base_path=tmp_path)
+    assert edited is not spec
+    assert edited.paths[0].get.summary == "Edited"
+
+    # Only the entry for the current version of the file is kept on disk
+    key = _cache_key(str(spec_file), ("/api/v1/users$",))
+    assert len([name for name in os.listdir(CACHE_DIR) if name.startswith(key)]) == 1
+
+
+def test_from_urls_isolates_failures_and_caches(
+    tmp_path, monkeypatch, sample_openapi_spec
+):
+    spec_file = tmp_path / "openapi.json"
+    with open(spec_file, "w") as f:
+        json.dump(sample_openapi_spec, f)
+
+    good_url = f"https://example.com/{tmp_path.name}/openapi.json"
+    bad_url = f"https://example.com/{tmp_path.name}/missing.json"
+    loaded = []
+
+    async def load_async(url, loader, plugins):
+        loaded.append(url)
+        if url == bad_url:
+            raise RuntimeError("fetch failed")
+        return aiopenapi3.OpenAPI.load_file(
+            str(spec_file),
+            str(spec_file),
+            loader=aiopenapi3.FileSystemLoader(tmp_path),
+            plugins=plugins,
+        )
+
+    monkeypatch.setattr(aiopenapi3.OpenAPI, "load_async", load_async)
+
+    good, bad = Spec.from_urls([good_url, bad_url], ["/api/v1/users$"])
+    assert [path.path for path in good.paths] == ["/api/v1/users"]
+    assert bad is None
+    assert sorted(loaded) == sorted([good_url, bad_url])
+
+    # The loaded spec is served from the cache; only the failed URL is retried
+    loaded.clear()
+    again, _ = Spec.from_urls([good_url, bad_url], ["/api/v1/users$"])
+    assert again is good
+    assert loaded == [bad_url]
+
+
+def test_spec_dict_round_trip(tmp_path, sample_openapi_spec):
+    spec_file = tmp_path / "openapi.json"
+    with open(spec_file, "w") as f:
+        json.dump(sample_openapi_spec, f)
+
+    spec = Spec.from_file(
+        str(spec_file), ["/api/v1/users$"], base_path=tmp_path, use_cache=False
+    )
+    data = json.loads(json.dumps(spec.to_dict()))
+    restored = Spec.from_dict(data)
+
+    assert restored.to_dict() == spec.to_dict()
+    assert repr(restored) == repr(spec)
+    assert Spec.load(spec.dump()).to_dict() == spec.to_dict()
+
+
 def test_request_response_processing(tmp_path, sample_openapi_spec):
     spec_file = tmp_path / "openapi.json"
     with open(spec_file, "w") as f:
@@ -748,6 +834,32 @@ def test_multiple_path_patterns(tmp_path, sample_openapi_spec):
     assert set(operations) == {"getUsers", "createUser", "getUser"}
 
 
+def test_path_patterns_with_clashing_group_names(tmp_path, sample_openapi_spec):
+    spec_file = tmp_path / "openapi.json"
+    with open(spec_file, "w") as f:
+        json.dump(sample_openapi_spec, f)
+
+    # These can't be joined into one regex, so each is matched separately
+    spec = Spec.from_file(
+        str(spec_file),
+        [r"/api/v1/(?P<name>users)$", r"/api/v1/(?P<name>users)/\{.*\}"],
+        base_path=tmp_path,
+        use_cache=False,
+    )
+    paths = {p.path for p in spec.paths}
+    assert paths == {"/api/v1/users", "/api/v1/users/{userId}"}
+
+
+def test_path_patterns_keep_their_backreferences():
+    # Joining these would renumber the groups and break the backreferences
+    matches = _path_matcher((r"(a)\1", r"(b)\1", "/plain"))
+    assert matches("aa")
+    assert matches("bb")
+    assert matches("/plain")
+    assert not matches("ab")
+    assert not _path_matcher(())("/anything")
+
+
 def test_reference_resolution(tmp_path, sample_openapi_spec_with_refs):
     spec_file = tmp_path / "openapi.json"
     with open(spec_file, "w") as f:
@@ -940,6 +1052,56 @@ def test_form_encoded_request_body(tmp_path, form_encoded_spec):
     assert {p.name for p in response_schema.properties} == {"id", "name"}
 
 
+def test_vendor_json_media_types(tmp_path):
+    spec_dict = {
+        "openapi": "3.0.0",
+        "info": {"title": "Vendor JSON API", "version": "1.0.0"},
+        "paths": {
+            "/articles": {
+                "post": {
+                    "operationId": "createArticle",
+                    "requestBody": {
+                        "content": {
+                            "application/vnd.api+json": {
+                                "schema": {
+                                    "type": "object",
+                                    "properties": {"title": {"type": "string"}},
+                                }
+                            }
+                        }
+                    },
+                    "responses": {
+                        "201": {
+                            "description": "Created",
+                            "content": {
+                                "application/vnd.api+json": {
+                                    "schema": {
+                                        "type": "object",
+                                        "properties": {"id": {"type": "string"}},
+                                    }
+                                }
+                            },
+                        }
+                    },
+                }
+            }
+        },
+    }
+    spec_file = tmp_path / "vendor_api.json"
+    with open(spec_file, "w") as f:
+        json.dump(spec_dict, f)
+
+    spec = Spec.from_file(
+        str(spec_file), ["/articles"], base_path=tmp_path, use_cache=False
+    )
+    post_op = spec.paths[0].post
+
+    assert post_op.request_body_.content_type == "application/vnd.api+json"
+    assert [p.name for p in post_op.request_body_.schema_.properties] == ["title"]
+    assert post_op.responses["201"].format == "application/json"
+    assert [p.name for p in post_op.responses["201"].schema_.properties] == ["id"]
+
+
 def test_circular_references():
     """Test handling of circular references in OpenAPI schemas."""
     # Create a test OpenAPI spec with circular references
@@ -4,7 +4,7 @@ import pytest
 # 3p
 from unittest.mock import AsyncMock, MagicMock
 from starlette.requests import Request
-from httpx import Response, AsyncClient
+from httpx import Response, AsyncClient, Timeout
 
 # local
 from mcp_openapi.proxy import MCPProxy
@@ -71,7 +71,6 @@ async def test_proxy_params(proxy, mock_request, mock_httpx_client):
         json=None,
         data=None,
         headers={},
-        timeout=None,
     )
 
 
@@ -102,8 +101,14 @@ async def test_proxy_forward_headers(proxy, mock_request, mock_httpx_client):
             "authorization": "Bearer test-token",
             "x-custom-header": "test-value",
         },
-        timeout=0.5,
     )
+    assert mock_httpx_client.timeout == 0.5
+
+    # Changes on a live client are applied to it, including clearing the timeout
+    proxy.timeout = 2.0
+    assert mock_httpx_client.timeout == Timeout(2.0)
+    proxy.timeout = None
+    assert mock_httpx_client.timeout == Timeout(None)
 
 
 @pytest.mark.asyncio
@@ -147,10 +152,27 @@ async def test_proxy_forward_query_params(proxy, mock_httpx_client):
             "other_param": "will_also_be_included",
         },
         headers={},
-        timeout=None,
     )
 
 
+@pytest.mark.asyncio
+async def test_proxy_forward_query_params_header_case(proxy, mock_httpx_client):
+    """Test that configured header names match regardless of case."""
+    proxy.forward_query_params = {"X-Open-Weather-App-Id": "appid"}
+    mock_request = Request(
+        scope={
+            "type": "http",
+            "headers": [(b"x-open-weather-app-id", b"weather123")],
+        }
+    )
+
+    await proxy.do_request(
+        request=mock_request, method="GET", url="https://api.example.com/test"
+    )
+
+    assert mock_httpx_client.request.call_args[1]["params"] == {"appid": "weather123"}
+
+
 @pytest.mark.asyncio
 async def test_proxy_json_body(proxy, mock_request, mock_httpx_client):
     """Test that JSON body is correctly passed."""
@@ -174,5 +196,49 @@ async def test_proxy_json_body(proxy, mock_request, mock_httpx_client):
         json=json_body,
         data=None,
         headers={},
-        timeout=None,
     )
+
+
+@pytest.mark.asyncio
+async def test_proxy_json_body_vendor_content_type(
+    proxy, mock_request, mock_httpx_client
+):
+    """Test that a vendor JSON media type is sent as the Content-Type."""
+    proxy.forward_headers = ["content-type"]
+
+    await proxy.do_request(
+        request=mock_request,
+        method="PATCH",
+        url="https://api.example.com/test",
+        json_body={"test": "data"},
+        json_content_type="application/merge-patch+json",
+    )
+
+    call_args = mock_httpx_client.request.call_args[1]
+    assert call_args["json"] == {"test": "data"}
+    assert call_args["headers"] == {"Content-Type": "application/merge-patch+json"}
+
+
+@pytest.mark.asyncio
+async def test_proxy_reuses_client(mock_request, mock_httpx_client):
+    """Test that one client is built and reused until the proxy is closed."""
+    builder = MagicMock(return_value=mock_httpx_client)
+    proxy = MCPProxy(client_builder=builder)
+
+    for _ in range(2):
+        await proxy.do_request(
+            request=mock_request, method="GET", url="https://api.example.com/test"
+        )
+
+    builder.assert_called_once()
+    mock_httpx_client.aclose.assert_not_called()
+
+    await proxy.aclose()
+    mock_httpx_client.aclose.assert_called_once()
+
+    # A closed proxy doesn't quietly build a new, untracked client
+    with pytest.raises(RuntimeError):
+        await proxy.do_request(
+            request=mock_request, method="GET", url="https://api.example.com/test"
+        )
+    builder.assert_called_once()
@@ -10,6 +10,7 @@ from mcp_openapi.tools import (
     Tool,
     ToolParameter,
     create_tool_function_exec,
+    create_tool_function_noexec,
     tools_from_spec,
 )
 from mcp_openapi.proxy import MCPProxy
@@ -230,39 +231,82 @@ def mock_operation():
     )
 
 
-# @pytest.mark.asyncio
-# async def test_tool_function_noexec(mock_tool, mock_context):
-#     """Test the noexec tool function creation"""
-#     # Create the tool function
-#     tool_func = create_tool_function_noexec(mock_tool)
+@pytest.mark.asyncio
+async def test_tool_function_noexec(mock_tool, mock_context):
+    """Test the noexec tool function creation"""
+    # Create the tool function
+    tool_func = create_tool_function_noexec(mock_tool)
+
+    # Mock httpx client
+    mock_response = AsyncMock()
+    mock_response.text = '{"result": "success"}'
+
+    # Create an AsyncMock for the client itself
+    mock_client_instance = AsyncMock()
+    mock_client_instance.request.return_value = mock_response
+    mock_client_instance.aclose = AsyncMock()  # Add mock for aclose method
+
+    with patch("httpx.AsyncClient") as mock_client:
+        # Return the mock client instance directly instead of using __aenter__
+        mock_client.return_value = mock_client_instance
+
+        # Test function execution
+        result = await tool_func(
+            mock_context, param1="test", param2=123, body_param={"key": "value"}
+        )
+
+        # Verify the request was made correctly
+        mock_client_instance.request.assert_called_once()
+        call_args = mock_client_instance.request.call_args[1]
+
+        assert call_args["method"] == "POST"
+        assert call_args["url"] == "http://test.com/test/path"
+        assert call_args["params"] == {"param1": "test", "param2": 123}
+        assert call_args["json"] == {"test": {"body_param": {"key": "value"}}}
+        assert result == '{"result": "success"}'
 
-#     # Mock httpx client
-#     mock_response = AsyncMock()
-#     mock_response.text = '{"result": "success"}'
 
-#     # Create an AsyncMock for the client itself
-#     mock_client_instance = AsyncMock()
-#     mock_client_instance.request.return_value = mock_response
-#     mock_client_instance.aclose = AsyncMock()  # Add mock for aclose method
+@pytest.mark.asyncio
+async def test_tool_function_vendor_json_content_type(mock_context):
+    """Test that a vendor JSON body is sent with its declared media type"""
+    tool = Tool(
+        name="patch_tool",
+        description="A patch tool",
+        query_params=[],
+        body_by_content_type={
+            "application/merge-patch+json": [
+                ToolParameter(name="title", type="str", request_body_field="title")
+            ]
+        },
+        method="PATCH",
+        path="/articles",
+    )
+    assert tool.json_content_type() == "application/merge-patch+json"
 
-#     with patch("httpx.AsyncClient") as mock_client:
-#         # Return the mock client instance directly instead of using __aenter__
-#         mock_client.return_value = mock_client_instance
+    mock_response = AsyncMock()
+    mock_response.text = "{}"
+    mock_client_instance = AsyncMock()
+    mock_client_instance.request.return_value = mock_response
+
+    with patch("httpx.AsyncClient") as mock_client:
+        mock_client.return_value = mock_client_instance
+        await create_tool_function_noexec(tool)(mock_context, title="New")
 
-#         # Test function execution
-#         result = await tool_func(
-#             mock_context, param1="test", param2=123, body_param={"key": "value"}
-#         )
+    call_args = mock_client_instance.request.call_args[1]
+    assert call_args["json"] == {"title": "New"}
+    assert call_args["headers"]["Content-Type"] == "application/merge-patch+json"
 
-#         # Verify the request was made correctly
-#         mock_client_instance.request.assert_called_once()
-#         call_args = mock_client_instance.request.call_args[1]
 
-#         assert call_args["method"] == "POST"
-#         assert call_args["url"] == "http://test.com/test/path"
-#         assert call_args["params"] == {"param1": "test", "param2": 123}
-#         assert call_args["json"] == {"body_param": {"key": "value"}}
-#         assert result == '{"result": "success"}'
+def test_tool_function_noexec_matches_exec(mock_tool, weather_tool):
+    """Test the noexec tool function exposes the same interface as the exec one"""
+    for tool in (mock_tool, weather_tool):
+        exec_func = create_tool_function_exec(tool)
+        noexec_func = create_tool_function_noexec(tool)
+
+        assert noexec_func.__name__ == exec_func.__name__
+        assert noexec_func.__doc__ == exec_func.__doc__
+        assert inspect.iscoroutinefunction(noexec_func)
+        assert str(inspect.signature(noexec_func)) == str(inspect.signature(exec_func))
 
 
 @pytest.mark.asyncio
@@ -484,6 +528,54 @@ def test_tool_from_operation(mock_operation):
     )
 
 
+def test_tool_from_operation_with_nullable_any_of_member():
+    """Test an anyOf member with an OpenAPI 3.1 type list, e.g. [string, "null"]"""
+    nullable = Schema.model_construct(
+        name="inline", type=["string", "null"], description=None
+    )
+    number = Schema.model_construct(name="inline", type="integer", description=None)
+    operation = Operation(
+        id="updateThing",
+        request_body_=RequestBody(
+            schema_=Schema.model_construct(
+                name="inline",
+                type="object",
+                properties=[
+                    Schema.model_construct(
+                        name="value",
+                        type=[nullable.type, number.type],
+                        description="A value",
+                        any_of=[nullable, number],
+                    )
+                ],
+            ),
+            content_type="application/json",
+        ),
+        responses={},
+    )
+
+    tool = Tool.from_operation("/things", "PUT", operation)
+
+    (param,) = tool.body_by_content_type["application/json"]
+    assert param.type == "Union[Any, int]"
+    assert param.description == "A value, one of: (string or null) OR (integer)"
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("", ""),
+        ("getWeather", "get_weather"),
+        ("GetWeather", "get_weather"),
+        ("getHTTPStatus", "get_h_t_t_p_status"),
+        ("already_snake", "already_snake"),
+        ("ids[]", "ids[]"),
+    ],
+)
+def test_to_snake_case(name, expected):
+    assert Tool._to_snake_case(name) == expected
+
+
 def test_tool_from_operation_with_long_enum():
     """Test Tool.from_operation with a long enum list that should be truncated"""
     # Create a long enum list